@@ -27,32 +27,19 @@ open class GraphicOverlay(context: Context?, attrs: AttributeSet?) :
         fun calculateRect(height: Float, width: Float, boundingBoxT: Rect): RectF {
 
             // for land scape
-            fun isLandScapeMode(): Boolean {
-                return overlay.context.resources.configuration.orientation == Configuration.ORIENTATION_LANDSCAPE
-            }
-
-            fun whenLandScapeModeWidth(): Float {
-                return when(isLandScapeMode()) {
-                    true -> width
-                    false -> height
-                }
-            }
-
-            fun whenLandScapeModeHeight(): Float {
-                return when(isLandScapeMode()) {
-                    true -> height
-                    false -> width
-                }
-            }
+            val isLandScapeMode =
+                overlay.context.resources.configuration.orientation == Configuration.ORIENTATION_LANDSCAPE
+            val landScapeModeWidth = if (isLandScapeMode) width else height
+            val landScapeModeHeight = if (isLandScapeMode) height else width
 
-            val scaleX = overlay.width.toFloat() / whenLandScapeModeWidth()
-            val scaleY = overlay.height.toFloat() / whenLandScapeModeHeight()
+            val scaleX = overlay.width.toFloat() / landScapeModeWidth
+            val scaleY = overlay.height.toFloat() / landScapeModeHeight
             val scale = scaleX.coerceAtLeast(scaleY)
             overlay.mScale = scale
 
             // Calculate offset (we need to center the overlay on the target)
-            val offsetX = (overlay.width.toFloat() - ceil(whenLandScapeModeWidth() * scale)) / 2.0f
-            val offsetY = (overlay.height.toFloat() - ceil(whenLandScapeModeHeight() * scale)) / 2.0f
+            val offsetX = (overlay.width.toFloat() - ceil(landScapeModeWidth * scale)) / 2.0f
+            val offsetY = (overlay.height.toFloat() - ceil(landScapeModeHeight * scale)) / 2.0f
 
             overlay.mOffsetX = offsetX
             overlay.mOffsetY = offsetY
@@ -13,25 +13,6 @@ class FaceContourGraphic(
     private val imageRect: Rect
 ) : GraphicOverlay.Graphic(overlay) {
 
-    private val facePositionPaint: Paint
-    private val idPaint: Paint
-    private val boxPaint: Paint
-
-    init {
-        val selectedColor = Color.WHITE
-
-        facePositionPaint = Paint()
-        facePositionPaint.color = selectedColor
-
-        idPaint = Paint()
-        idPaint.color = selectedColor
-
-        boxPaint = Paint()
-        boxPaint.color = selectedColor
-        boxPaint.style = Paint.Style.STROKE
-        boxPaint.strokeWidth = BOX_STROKE_WIDTH
-    }
-
     override fun draw(canvas: Canvas?) {
         val rect = calculateRect(
             imageRect.height().toFloat(),
@@ -43,6 +24,13 @@ class FaceContourGraphic(
 
     companion object {
         private const val BOX_STROKE_WIDTH = 5.0f
+
+        // shared by every graphic; safe only because GraphicOverlay draws on the UI thread
+        private val boxPaint = Paint().apply {
+            color = Color.WHITE
+            style = Paint.Style.STROKE
+            strokeWidth = BOX_STROKE_WIDTH
+        }
     }
 
-}
\ No newline at end of file
+}